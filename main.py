@@ -1,20 +1,98 @@
+import sqlite3
+import threading
 import tkinter as tk
-from tkinter import ttk, messagebox
-import random
-import string
-import csv
+from tkinter import ttk, simpledialog
+
+import numpy as np
+import pandas as pd
+from PIL import Image, ImageDraw, ImageTk
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to plain Python
+    def njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
+
+@njit(cache=True)
+def _flip_seats(status, selected_mask, old, new):
+    """Set every selected seat whose status is `old` to `new`, returning the changed mask"""
+    mask = selected_mask & (status == old)
+    rows, cols = np.where(mask)
+    for i in range(rows.size):
+        status[rows[i], cols[i]] = new
+    return mask
+
+
+# Seat type codes used in the seat_type array
+TYPE_ECONOMY = 0
+TYPE_FIRST = 1
+TYPE_STORAGE = 2
+TYPE_AISLE = 3
+TYPE_NAMES = ('Economy', 'First', 'Storage', 'Aisle')
+
+# Hot-path SQL, hoisted so the connection's statement cache always keys
+# on the same string objects
+_SQL_LOAD_SEATS = "SELECT booking_reference, seat_row, seat_column FROM booked_seats"
+_SQL_LOAD_PASSENGERS = "SELECT booking_reference, passport_number, first_name, last_name FROM bookings"
+_SQL_INSERT_BOOKING = ("INSERT OR IGNORE INTO bookings (booking_reference, passport_number, first_name, last_name) "
+                       "VALUES (?, ?, ?, ?)")
+_SQL_INSERT_SEAT = ("INSERT INTO booked_seats (booking_reference, seat_row, seat_column, seat_type) "
+                    "VALUES (?, ?, ?, ?)")
+_SQL_DELETE_SEAT = ("DELETE FROM booked_seats "
+                    "WHERE booking_reference = ? AND seat_row = ? AND seat_column = ?")
+
+# Human-readable seat status labels
+STATUS_TEXT = {
+    'F': 'Free',
+    'R': 'Reserved',
+    'A': 'Aisle',
+    'S': 'Storage'
+}
 
 
 class SeatBookingSystem:
     def __init__(self):
         self.num_rows = 7
         self.num_cols = 80
-        # Initialize seats with type information (tuple: status, seat_type, booking_reference)
-        self.seats = [[('F', 'Economy', None) for _ in range(self.num_cols)] for _ in range(self.num_rows)]
+        # Structure-of-arrays seat state: status byte, seat type code and
+        # booking reference per cell instead of a grid of Python tuples.
+        # The special seats (aisle row, storage columns, first class) are
+        # marked as part of construction rather than in a second pass.
+        self.status = np.full((self.num_rows, self.num_cols), ord('F'), dtype=np.uint8)
+        self.seat_type = np.full((self.num_rows, self.num_cols), TYPE_ECONOMY, dtype=np.uint8)
+        self.ref = np.full((self.num_rows, self.num_cols), '', dtype='U8')  # '' = no booking
         self.row_letters = 'ABCDEFG'
-        self.mark_special_seats()
-        self.selected_seats = set()  # Store multiple selected seats
-        self.booking_references = set()  # Store unique booking references
+        self._row_index = {letter: i for i, letter in enumerate(self.row_letters)}
+        self._seat_names = np.array([[f"{self.row_letters[r]}{c + 1}" for c in range(self.num_cols)]
+                                     for r in range(self.num_rows)])
+
+        # Row D is the aisle
+        self.status[3, :] = ord('A')
+        self.seat_type[3, :] = TYPE_AISLE
+
+        # Storage columns (row D stays aisle): one indexed assignment over
+        # the non-aisle rows instead of writing row 3 and restoring it
+        storage_columns = np.array([13, 14, 15, 28, 29, 30, 43, 44, 45, 58, 59, 60, 73, 74, 75])
+        seat_rows = np.array([r for r in range(self.num_rows) if r != 3])
+        self.status[np.ix_(seat_rows, storage_columns)] = ord('S')
+        self.seat_type[np.ix_(seat_rows, storage_columns)] = TYPE_STORAGE
+
+        # Set First Class seats (columns 1-30): the eligible cells are just
+        # the non-storage columns in the non-aisle rows, so index them
+        # directly instead of re-checking the freshly initialized status
+        first_columns = np.setdiff1d(np.arange(30), storage_columns)
+        self.seat_type[np.ix_(seat_rows, first_columns)] = TYPE_FIRST
+
+        # Aisle and storage cells never change, so which seats can be
+        # clicked/selected is fixed from here on
+        self.clickable = (self.status != ord('A')) & (self.status != ord('S'))
+        self.selected_mask = np.zeros((self.num_rows, self.num_cols), dtype=bool)  # Currently selected seats
+        self.changes = []  # (row, col) cells mutated since the GUI last repainted
+        self._ref_pool = []  # Pre-generated booking references, drawn lazily
+        self.initialize_database()
 
         # Define seat types and their colors
         self.seat_types = {
@@ -24,128 +102,272 @@ class SeatBookingSystem:
             'Aisle': 'gray'
         }
 
-    def mark_special_seats(self):
-        """Marks special seats and their types in the seating layout"""
-        # Mark row D as aisle
-        for col in range(self.num_cols):
-            self.seats[3][col] = ('A', 'Aisle', None)  # Changed 'X' to 'A' for Aisle
-
-        # Storage columns
-        storage_columns = [13, 14, 15, 28, 29, 30, 43, 44, 45, 58, 59, 60, 73, 74, 75]
-        for col in storage_columns:
-            for row in range(self.num_rows):
-                if row != 3:
-                    self.seats[row][col] = ('S', 'Storage', None)
-
-        # Set First Class seats (columns 1-30)
-        for col in range(30):
-            for row in range(self.num_rows):
-                if self.seats[row][col][0] == 'F':
-                    self.seats[row][col] = ('F', 'First', None)
+    def initialize_database(self):
+        """Open the bookings database, creating the schema if needed"""
+        self.conn = sqlite3.connect('airline_bookings.db', cached_statements=256,
+                                    check_same_thread=False)
+        # WAL journaling plus relaxed sync: one fsync per commit instead of
+        # several, and readers no longer block writers
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute("PRAGMA cache_size=-8000")
+        self.cursor = self.conn.cursor()
+        self.cursor.execute('''CREATE TABLE IF NOT EXISTS bookings (
+            booking_reference TEXT PRIMARY KEY,
+            passport_number TEXT NOT NULL,
+            first_name TEXT NOT NULL,
+            last_name TEXT NOT NULL
+        )''')
+        self.cursor.execute('''CREATE TABLE IF NOT EXISTS booked_seats (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            booking_reference TEXT NOT NULL,
+            seat_row TEXT NOT NULL,
+            seat_column INTEGER NOT NULL,
+            seat_type TEXT NOT NULL,
+            FOREIGN KEY (booking_reference) REFERENCES bookings (booking_reference)
+        )''')
+        # Index the delete/count lookups so they are B-tree descents
+        # instead of full table scans
+        self.cursor.execute('''CREATE INDEX IF NOT EXISTS idx_booked_seats_ref
+            ON booked_seats (booking_reference)''')
+        self.cursor.execute('''CREATE UNIQUE INDEX IF NOT EXISTS idx_booked_seats_pos
+            ON booked_seats (booking_reference, seat_row, seat_column)''')
+        # A seat can only belong to one booking; enforced as a unique index
+        # (rather than a table constraint) so existing databases get it too
+        self.cursor.execute('''CREATE UNIQUE INDEX IF NOT EXISTS idx_booked_seats_seat
+            ON booked_seats (seat_row, seat_column)''')
+        self.conn.commit()
+
+        # Passenger details cached once at startup; get_seat_status reads
+        # this dict instead of querying per clicked seat
+        self.cursor.execute(_SQL_LOAD_PASSENGERS)
+        self._passengers = {ref: (passport, first, last)
+                            for ref, passport, first, last in self.cursor.fetchall()}
+
+    def fetch_booked_seats(self):
+        """Read the persisted seat bookings as three parallel column tuples;
+        safe to call from a worker thread"""
+        cursor = self.conn.cursor()  # own cursor: the shared one is not thread-safe
+        cursor.execute(_SQL_LOAD_SEATS)
+        # Stream rows straight off the cursor into columns instead of
+        # materializing fetchall()'s intermediate list of row tuples
+        return tuple(zip(*cursor)) or ((), (), ())
+
+    def apply_loaded_bookings(self, booked_seats):
+        """Restore fetched seat bookings into the seat arrays"""
+        refs, row_letters, col_nums = booked_seats
+        if not refs:
+            return
+        # One fancy-indexed store per array instead of a Python-level
+        # write per booked seat
+        rows = np.array([self._row_index[letter] for letter in row_letters])
+        cols = np.array(col_nums) - 1
+        self.status[rows, cols] = ord('R')
+        self.ref[rows, cols] = refs
+        self.changes.extend(zip(rows.tolist(), cols.tolist()))
+
+    def load_bookings_from_database(self):
+        """Fetch and apply the persisted bookings in one synchronous step"""
+        self.apply_loaded_bookings(self.fetch_booked_seats())
 
     def get_seat_name(self, row, col):
-        return f"{self.row_letters[row]}{col + 1}"
+        return self._seat_names[row, col]
+
+    @property
+    def selected_seats(self):
+        """Selected (row, col) pairs, derived from the boolean mask"""
+        return [(int(r), int(c)) for r, c in zip(*np.nonzero(self.selected_mask))]
 
     def toggle_seat_selection(self, row, col):
         """Toggle seat selection for bulk booking"""
-        seat_pos = (row, col)
-        status, seat_type, _ = self.seats[row][col]
-
         # Only allow selection of free or reserved seats
-        if status not in ['F', 'R']:
+        if not self.clickable[row, col]:
             return False, None  # Return None to indicate no selection change
 
-        if seat_pos in self.selected_seats:
-            self.selected_seats.remove(seat_pos)
-            return True, f"Unselected seat {self.get_seat_name(row, col)}"
-        else:
-            self.selected_seats.add(seat_pos)
+        self.selected_mask[row, col] ^= True
+        self.changes.append((row, col))
+        if self.selected_mask[row, col]:
             return True, f"Selected seat {self.get_seat_name(row, col)}"
+        else:
+            return True, f"Unselected seat {self.get_seat_name(row, col)}"
 
-    def book_seats(self, priority_booking=False):
-        """Book multiple selected seats"""
-        if not self.selected_seats:
+    def book_seats(self, priority_booking=False, passenger=None):
+        """Book multiple selected seats, optionally recording (passport, first, last)"""
+        if not self.selected_mask.any():
             return False, "No seats selected"
+        passport, first_name, last_name = passenger or ('', '', '')
 
-        # Book all selected seats
-        booked_seats = []
+        # Every selected seat changes appearance (booked or merely
+        # unselected), so log them all as changed
+        self.changes.extend(self.selected_seats)
         booking_reference = self.generate_booking_reference()
-        for row, col in self.selected_seats:
-            status, seat_type, _ = self.seats[row][col]
-            if status == 'F':
-                self.seats[row][col] = ('R', seat_type, booking_reference)
-                booked_seats.append(self.get_seat_name(row, col))
-
-        self.selected_seats.clear()
-        return True, f"Booked seats: {', '.join(booked_seats)}. Reference: {booking_reference}"
+        mask = _flip_seats(self.status, self.selected_mask, ord('F'), ord('R'))
+        booked_seats = self._seat_names[mask]
+        booked_coords = list(zip(*np.nonzero(mask)))
+
+        # Persist the whole booking as one transaction: a single batched
+        # executemany instead of one INSERT (and commit) per seat. The
+        # bookings PRIMARY KEY doubles as the reference collision check:
+        # INSERT OR IGNORE inserting nothing means the reference is taken,
+        # so draw a fresh one and retry (vanishingly rare).
+        if booked_coords:
+            try:
+                with self.conn:
+                    self.cursor.execute(_SQL_INSERT_BOOKING,
+                                        (booking_reference, passport, first_name, last_name))
+                    while self.cursor.rowcount == 0:
+                        booking_reference = self.generate_booking_reference()
+                        self.cursor.execute(_SQL_INSERT_BOOKING,
+                                            (booking_reference, passport, first_name, last_name))
+                    self.cursor.executemany(
+                        _SQL_INSERT_SEAT,
+                        [(booking_reference, self.row_letters[r], int(c) + 1, TYPE_NAMES[self.seat_type[r, c]])
+                         for r, c in booked_coords])
+            except sqlite3.IntegrityError:
+                # Another writer booked one of these seats first; the
+                # transaction rolled back, so undo the in-memory flip too
+                self.status[mask] = ord('F')
+                self.selected_mask[:] = False
+                return False, "Booking failed: a selected seat was already booked elsewhere"
+            self._passengers[booking_reference] = (passport, first_name, last_name)
+        self.ref[mask] = booking_reference
+
+        self.selected_mask[:] = False
+        return True, f"Booked seats: {', '.join(booked_seats.tolist())}. Reference: {booking_reference}"
 
     def free_seats(self):
         """Free multiple selected seats"""
-        if not self.selected_seats:
+        if not self.selected_mask.any():
             return False, "No seats selected"
 
-        freed_seats = []
-        for row, col in self.selected_seats:
-            status, seat_type, _ = self.seats[row][col]
-            if status == 'R':
-                self.seats[row][col] = ('F', seat_type, None)
-                freed_seats.append(self.get_seat_name(row, col))
-
-        self.selected_seats.clear()
-        return True, f"Freed seats: {', '.join(freed_seats)}"
+        self.changes.extend(self.selected_seats)
+        freed_coords = list(zip(*np.nonzero(self.selected_mask & (self.status == ord('R')))))
+        freed_refs = {self.ref[r, c] for r, c in freed_coords}
+        seat_rows = [(self.ref[r, c], self.row_letters[r], int(c) + 1) for r, c in freed_coords]
+        mask = _flip_seats(self.status, self.selected_mask, ord('R'), ord('F'))
+        self.ref[mask] = ''
+        freed_seats = self._seat_names[mask]
+
+        # Batched seat deletes in one transaction; drop bookings that no
+        # longer have any seats
+        if seat_rows:
+            with self.conn:
+                self.cursor.executemany(_SQL_DELETE_SEAT, seat_rows)
+                # One grouped query finds which references still have seats,
+                # one IN (...) delete drops the emptied bookings
+                placeholders = ','.join('?' * len(freed_refs))
+                self.cursor.execute(
+                    f"SELECT booking_reference FROM booked_seats "
+                    f"WHERE booking_reference IN ({placeholders}) "
+                    f"GROUP BY booking_reference", list(freed_refs))
+                empty_refs = freed_refs - {ref for (ref,) in self.cursor.fetchall()}
+                if empty_refs:
+                    self.cursor.execute(
+                        f"DELETE FROM bookings WHERE booking_reference IN "
+                        f"({','.join('?' * len(empty_refs))})", list(empty_refs))
+                    for ref in empty_refs:
+                        self._passengers.pop(ref, None)
+
+        self.selected_mask[:] = False
+        return True, f"Freed seats: {', '.join(freed_seats.tolist())}"
+
+    def _free_row_bits(self, row):
+        """Pack one row's free seats into an 80-bit integer (bit c set = column c free)"""
+        free = self.status[row] == ord('F')
+        return int.from_bytes(np.packbits(free, bitorder='little').tobytes(), 'little')
+
+    def count_free_seats(self):
+        """Count free seats across the whole plane via popcount on the packed rows"""
+        return sum(self._free_row_bits(row).bit_count() for row in range(self.num_rows))
+
+    def find_contiguous_free_seats(self, count):
+        """Find `count` adjacent free seats in one row, or None if no row has such a run
+
+        Uses a shift-AND reduction on the packed row bits: after the loop,
+        bit c survives only if columns c..c+count-1 are all free.
+        """
+        if count < 1:
+            return None
+        for row in range(self.num_rows):
+            bits = self._free_row_bits(row)
+            done = 1
+            while done < count and bits:
+                step = min(done, count - done)
+                bits &= bits >> step
+                done += step
+            if bits:
+                col = (bits & -bits).bit_length() - 1
+                return row, col
+        return None
 
     def get_seat_status(self, row, col):
         """Get the status of a specific seat"""
         if not (0 <= row < self.num_rows and 0 <= col < self.num_cols):
             return "Invalid seat position"
 
-        status, seat_type, booking_reference = self.seats[row][col]
+        status = chr(self.status[row, col])
+        seat_type = TYPE_NAMES[self.seat_type[row, col]]
+        booking_reference = self.ref[row, col]
         seat_name = self.get_seat_name(row, col)
 
-        status_map = {
-            'F': 'Free',
-            'R': 'Reserved',
-            'A': 'Aisle',
-            'S': 'Storage'
-        }
-
-        status_text = status_map.get(status, 'Unknown')
+        status_text = STATUS_TEXT.get(status, 'Unknown')
         if status == 'R':
-            return f"Seat {seat_name} is {status_text} ({seat_type} Class). Reference: {booking_reference}"
+            message = f"Seat {seat_name} is {status_text} ({seat_type} Class). Reference: {booking_reference}"
+            passenger = self._passengers.get(booking_reference)
+            if passenger and (passenger[1] or passenger[2]):
+                message += f". Passenger: {passenger[1]} {passenger[2]}".rstrip()
+            return message
         else:
             return f"Seat {seat_name} is {status_text} ({seat_type} Class)"
 
     def generate_booking_reference(self):
-        """Generate a unique random booking reference with 8 alphanumeric characters"""
-        while True:
-            reference = ''.join(random.choices(string.ascii_uppercase + string.digits, k=8))
-            if reference not in self.booking_references:
-                self.booking_references.add(reference)
-                return reference
+        """Generate a random booking reference with 8 alphanumeric characters
+
+        The pool is refilled 64 references at a time from a single
+        os.urandom read encoded as base32 (alphabet A-Z2-7). Uniqueness is
+        enforced by the bookings PRIMARY KEY when the booking is inserted,
+        so no in-memory reference set is kept.
+        """
+        if not self._ref_pool:
+            import base64, os  # deferred: only needed once a booking is made
+            buf = base64.b32encode(os.urandom(320)).decode()
+            self._ref_pool = [buf[i:i + 8] for i in range(0, 512, 8)]
+        return self._ref_pool.pop()
 
     def get_booking_dataset(self):
-        """Return a dataset of the current booking status of all seats"""
-        dataset = []
-        for row in range(self.num_rows):
-            for col in range(self.num_cols):
-                status, seat_type, booking_reference = self.seats[row][col]
-                seat_name = self.get_seat_name(row, col)
-                dataset.append({
-                    'seat_name': seat_name,
-                    'row': self.row_letters[row],
-                    'column': col + 1,
-                    'status': status,
-                    'seat_type': seat_type,
-                    'booking_reference': booking_reference
-                })
-        return dataset
+        """Return a DataFrame of the current booking status of all seats"""
+        return pd.DataFrame({
+            'seat_name': self._seat_names.ravel(),
+            'row': np.repeat(list(self.row_letters), self.num_cols),
+            'column': np.tile(np.arange(1, self.num_cols + 1), self.num_rows),
+            'status': self.status.ravel().view('S1').astype('U1'),
+            'seat_type': np.take(TYPE_NAMES, self.seat_type.ravel()),
+            'booking_reference': self.ref.ravel()
+        })
 
 
 class SeatBookingGUI:
+    # Geometry of the canvas seat grid
+    CELL_W = 20
+    CELL_H = 24
+    LEFT_PAD = 30
+    TOP_PAD = 20
+
     def __init__(self, root):
         self.root = root
         self.root.title("Seat Booking System")
         self.booking_system = SeatBookingSystem()
+        self._dirty = set()  # (row, col) cells changed since the last repaint
+        # Every (status, seat_type, is_selected) -> draw options entry,
+        # built up front so painting never branches through style logic
+        self._styles = {(status, seat_type, is_selected):
+                        self._compute_style(status, seat_type, is_selected)
+                        for status in STATUS_TEXT
+                        for seat_type in TYPE_NAMES
+                        for is_selected in (False, True)}
+        self._last_cell_key = {}  # (row, col) -> last painted style key
+        self._redraw_scheduled = False
 
         window_width = 1200
         window_height = 600
@@ -159,6 +381,18 @@ class SeatBookingGUI:
         self.create_widgets()
         self.create_seating_display()
 
+        # Load persisted bookings off the main thread so the window appears
+        # immediately; the results are applied back on the Tk event loop
+        threading.Thread(target=self._load_bookings_async, daemon=True).start()
+
+    def _load_bookings_async(self):
+        booked_seats = self.booking_system.fetch_booked_seats()
+        self.root.after(0, self._apply_loaded_bookings, booked_seats)
+
+    def _apply_loaded_bookings(self, booked_seats):
+        self.booking_system.apply_loaded_bookings(booked_seats)
+        self._request_redraw()
+
     def create_menu(self):
         menubar = tk.Menu(self.root)
         self.root.config(menu=menubar)
@@ -168,6 +402,7 @@ class SeatBookingGUI:
         operations_menu.add_command(label="Book Selected Seats", command=lambda: self.book_selected_seats(False))
         operations_menu.add_command(label="Free Selected Seats", command=self.free_selected_seats)
         operations_menu.add_command(label="Check Status", command=self.check_selected_status)
+        operations_menu.add_command(label="Select Adjacent Seats", command=self.select_adjacent_seats)
         operations_menu.add_command(label="Export Booking Data", command=self.export_booking_data)
         operations_menu.add_separator()
         operations_menu.add_command(label="Exit", command=self.root.quit)
@@ -209,70 +444,117 @@ class SeatBookingGUI:
         canvas_frame = ttk.LabelFrame(self.main_frame, text="Seating Layout", padding="10")
         canvas_frame.grid(row=4, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S))
 
-        canvas = tk.Canvas(canvas_frame, width=1150, height=300)
+        num_rows = self.booking_system.num_rows
+        num_cols = self.booking_system.num_cols
+        canvas = tk.Canvas(canvas_frame, width=1150, height=self.TOP_PAD + num_rows * self.CELL_H + 10)
         scrollbar = ttk.Scrollbar(canvas_frame, orient="horizontal", command=canvas.xview)
         canvas.configure(xscrollcommand=scrollbar.set)
 
         scrollbar.grid(row=1, column=0, sticky=(tk.W, tk.E))
         canvas.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
-
-        self.seats_frame = ttk.Frame(canvas)
-        canvas.create_window((0, 0), window=self.seats_frame, anchor="nw")
-
-        ttk.Label(self.seats_frame, text="   ").grid(row=0, column=0)
-        for col in range(self.booking_system.num_cols):
-            if (col + 1) % 5 == 0:
-                ttk.Label(self.seats_frame, text=f"{col + 1}", font=('Helvetica', 8)).grid(row=0, column=col + 1)
-
-        self.seat_buttons = []
-        for row in range(self.booking_system.num_rows):
-            row_buttons = []
-            ttk.Label(self.seats_frame, text=f"{self.booking_system.row_letters[row]}:").grid(row=row + 1, column=0,
-                                                                                              padx=2)
-            for col in range(self.booking_system.num_cols):
-                status, seat_type, _ = self.booking_system.seats[row][col]
-                seat_button = tk.Label(self.seats_frame, text=status,
-                                       width=2, relief="raised", borderwidth=1, fg='black')
-                seat_button.grid(row=row + 1, column=col + 1, padx=1, pady=1)
-                seat_button.bind('<Button-1>', lambda e, r=row, c=col: self.on_seat_click(r, c))
-
-                self.update_seat_color(seat_button, status, seat_type)
-                row_buttons.append(seat_button)
-            self.seat_buttons.append(row_buttons)
-
-        self.seats_frame.update_idletasks()
-        canvas.configure(scrollregion=canvas.bbox("all"))
-
-    def update_seat_color(self, button, status, seat_type, is_selected=False):
+        self.canvas = canvas
+
+        # Column headers (every 5th column) and row letters drawn directly on the canvas
+        for col in range(4, num_cols, 5):
+            canvas.create_text(self.LEFT_PAD + col * self.CELL_W + self.CELL_W / 2, self.TOP_PAD / 2,
+                               text=f"{col + 1}", font=('Helvetica', 8))
+        for row in range(num_rows):
+            canvas.create_text(self.LEFT_PAD / 2, self.TOP_PAD + row * self.CELL_H + self.CELL_H / 2,
+                               text=f"{self.booking_system.row_letters[row]}:")
+
+        # The whole seat grid renders into one backing image shown by a
+        # single create_image item, so the canvas never holds per-seat items
+        self._grid_image = Image.new('RGB', (num_cols * self.CELL_W, num_rows * self.CELL_H), 'white')
+        self._grid_draw = ImageDraw.Draw(self._grid_image)
+        for row in range(num_rows):
+            for col in range(num_cols):
+                self._paint_cell(row, col)
+        self._photo = ImageTk.PhotoImage(self._grid_image)
+        canvas.create_image(self.LEFT_PAD, self.TOP_PAD, image=self._photo, anchor='nw')
+
+        canvas.bind('<Button-1>', self._on_canvas_click)
+        # The layout is deterministic, so compute the scrollregion directly
+        # instead of measuring all items with bbox("all")
+        canvas.configure(scrollregion=(0, 0, self.LEFT_PAD + num_cols * self.CELL_W + 10,
+                                       self.TOP_PAD + num_rows * self.CELL_H + 10))
+
+    def _on_canvas_click(self, event):
+        col = int((self.canvas.canvasx(event.x) - self.LEFT_PAD) // self.CELL_W)
+        row = int((self.canvas.canvasy(event.y) - self.TOP_PAD) // self.CELL_H)
+        if 0 <= row < self.booking_system.num_rows and 0 <= col < self.booking_system.num_cols:
+            self.on_seat_click(row, col)
+
+    def _paint_cell(self, row, col):
+        """Redraw one seat's block in the backing image; returns False if nothing changed"""
+        status = chr(self.booking_system.status[row, col])
+        seat_type = TYPE_NAMES[self.booking_system.seat_type[row, col]]
+        is_selected = bool(self.booking_system.selected_mask[row, col])
+
+        key = (status, seat_type, is_selected)
+        if self._last_cell_key.get((row, col)) == key:
+            return False
+        self._last_cell_key[(row, col)] = key
+        style = self._styles[key]
+
+        x = col * self.CELL_W
+        y = row * self.CELL_H
+        self._grid_draw.rectangle([x, y, x + self.CELL_W - 1, y + self.CELL_H - 1],
+                                  fill=style['fill'], outline=style['outline'], width=style['width'])
+        self._grid_draw.text((x + self.CELL_W // 2 - 3, y + self.CELL_H // 2 - 5), status, fill='black')
+        return True
+
+    def _compute_style(self, status, seat_type, is_selected):
+        """Resolve the canvas item options for one seat state (~16 distinct keys)"""
         base_color = self.booking_system.seat_types.get(seat_type, 'white')
 
         if is_selected:
-            button.configure(bg='yellow', relief="sunken", fg='black')
-        else:
-            if status == 'R':
-                button.configure(bg='lightgreen', relief="raised", fg='black')
-            else:
-                if seat_type == 'First':
-                    button.configure(bg=base_color, relief="solid", borderwidth=2, highlightbackground='gold',
-                                     highlightthickness=2, fg='black')
-                else:
-                    button.configure(bg=base_color, relief="raised", fg='black')
+            return {'fill': 'yellow', 'outline': 'black', 'width': 1}
+        if status == 'R':
+            return {'fill': 'lightgreen', 'outline': 'black', 'width': 1}
+        if seat_type == 'First':
+            return {'fill': base_color, 'outline': 'gold', 'width': 2}
+        return {'fill': base_color, 'outline': 'black', 'width': 1}
 
     def on_seat_click(self, row, col):
         success, message = self.booking_system.toggle_seat_selection(row, col)
         if message is not None:  # Only update if there was a selection change
             self.update_status(message)
-            self.update_seat_display()
+            self._request_redraw()
 
     def book_selected_seats(self, priority=False):
-        success, message = self.booking_system.book_seats(priority)
+        passenger = None
+        if self.booking_system.selected_mask.any():
+            passport = simpledialog.askstring("Passenger Details", "Passport number:", parent=self.root)
+            first_name = simpledialog.askstring("Passenger Details", "First name:", parent=self.root)
+            last_name = simpledialog.askstring("Passenger Details", "Last name:", parent=self.root)
+            passenger = (passport or '', first_name or '', last_name or '')
+        success, message = self.booking_system.book_seats(priority, passenger)
         self.update_status(message)
-        self.update_seat_display()
+        self._request_redraw()
 
     def free_selected_seats(self):
         success, message = self.booking_system.free_seats()
         self.update_status(message)
-        self.update_seat_display()
+        self._request_redraw()
+
+    def select_adjacent_seats(self):
+        count = simpledialog.askinteger("Adjacent Seats", "How many adjacent seats?",
+                                        parent=self.root, minvalue=1, maxvalue=self.booking_system.num_cols)
+        if count is None:
+            return
+
+        found = self.booking_system.find_contiguous_free_seats(count)
+        if found is None:
+            self.update_status(f"No {count} adjacent free seats available "
+                               f"({self.booking_system.count_free_seats()} free in total)")
+            return
+
+        row, col = found
+        for c in range(col, col + count):
+            self.booking_system.toggle_seat_selection(row, c)
+        self.update_status(f"Selected seats {self.booking_system.get_seat_name(row, col)} to "
+                           f"{self.booking_system.get_seat_name(row, col + count - 1)}")
+        self._request_redraw()
 
     def check_selected_status(self):
         if not self.booking_system.selected_seats:
@@ -286,14 +568,29 @@ class SeatBookingGUI:
 
         self.update_status("\n".join(status_messages))
 
+    def _request_redraw(self):
+        # Coalesce bursts of changes into one repaint per idle cycle
+        if not self._redraw_scheduled:
+            self._redraw_scheduled = True
+            self.root.after_idle(self._do_redraw)
+
+    def _do_redraw(self):
+        self._redraw_scheduled = False
+        self.update_seat_display()
+
     def update_seat_display(self):
-        for row in range(self.booking_system.num_rows):
-            for col in range(self.booking_system.num_cols):
-                status, seat_type, _ = self.booking_system.seats[row][col]
-                button = self.seat_buttons[row][col]
-                is_selected = (row, col) in self.booking_system.selected_seats
-                self.update_seat_color(button, status, seat_type, is_selected)
-                button.configure(text=status)
+        # Drain the model's mutation log, patch those cells in the backing
+        # image, then push the image to the canvas in one blit
+        self._dirty.update(self.booking_system.changes)
+        self.booking_system.changes.clear()
+        if not self._dirty:
+            return
+        painted = False
+        for row, col in self._dirty:
+            painted = self._paint_cell(row, col) or painted
+        if painted:
+            self._photo.paste(self._grid_image)
+        self._dirty.clear()
 
     def update_status(self, message):
         self.status_var.set(message)
@@ -301,11 +598,7 @@ class SeatBookingGUI:
     def export_booking_data(self):
         dataset = self.booking_system.get_booking_dataset()
         try:
-            with open('seat_booking_status.csv', 'w', newline='') as file:
-                writer = csv.DictWriter(file, fieldnames=['seat_name', 'row', 'column', 'status', 'seat_type',
-                                                          'booking_reference'])
-                writer.writeheader()
-                writer.writerows(dataset)
+            dataset.to_csv('seat_booking_status.csv', index=False)
             self.update_status("Booking data exported to seat_booking_status.csv")
         except Exception as e:
             self.update_status(f"Error exporting data: {str(e)}")